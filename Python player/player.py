@@ -0,0 +1,1037 @@
+"""
+QuickSeed-Engine Python Video Player
+Video player window and Go backend process management
+"""
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import av
+import numpy as np
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+import os
+import subprocess
+import signal
+import socket
+import tempfile
+import urllib.parse
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import websocket
+import sys
+
+# Initial main window size
+DEFAULT_WIDTH = 1400
+DEFAULT_HEIGHT = 900
+
+# Largest frame size ever encoded for display
+MAX_DISPLAY_WIDTH = 1920
+MAX_DISPLAY_HEIGHT = 1080
+
+# File extensions offered for playback
+VIDEO_EXTS = frozenset(('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.m2ts'))
+
+class QuickSeedBackend:
+    """Manages the QuickSeed-Engine Go backend"""
+    
+    def __init__(self, engine_path):
+        self.engine_path = engine_path
+        self.process = None
+        self.port = 8080
+        self.host = "localhost"
+        self.base_url = f"http://{self.host}:{self.port}"
+        
+        # Shared keep-alive connection pool for API calls
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.headers['Connection'] = 'keep-alive'
+        
+    def find_available_port(self):
+        """Find an available port for the backend"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(('', 0))
+            s.listen(1)
+            port = s.getsockname()[1]
+        return port
+    
+    def start_engine(self):
+        """Start the QuickSeed-Engine backend"""
+        if self.is_running():
+            return True
+            
+        try:
+            # Check if binary exists
+            if not os.path.exists(self.engine_path):
+                print(f"QuickSeed binary not found at: {self.engine_path}")
+                return False
+                
+            # Find available port
+            self.port = self.find_available_port()
+            self.base_url = f"http://{self.host}:{self.port}"
+            
+            # Start the Go backend process
+            cmd = [self.engine_path, "--port", str(self.port)]
+            
+            if sys.platform == 'win32':
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+                )
+            else:
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    preexec_fn=os.setsid
+                )
+            
+            # Wait for the backend to start, backing off from 25ms up to 500ms
+            delay = 0.025
+            deadline = time.monotonic() + 30  # 30 second timeout
+            while time.monotonic() < deadline:
+                try:
+                    response = self.session.get(f"{self.base_url}/health", timeout=0.5)
+                    if response.status_code == 200:
+                        print(f"QuickSeed-Engine started on port {self.port}")
+                        return True
+                except requests.RequestException:
+                    pass
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                    
+            print("Failed to start QuickSeed-Engine (timeout)")
+            return False
+            
+        except Exception as e:
+            print(f"Error starting QuickSeed-Engine: {e}")
+            return False
+    
+    def stop_engine(self):
+        """Stop the QuickSeed-Engine backend"""
+        if self.process:
+            try:
+                if sys.platform == 'win32':
+                    self.process.terminate()
+                else:
+                    os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
+                    
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                if sys.platform == 'win32':
+                    self.process.kill()
+                else:
+                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
+            finally:
+                self.process = None
+                
+    def is_running(self):
+        """Check if the backend is running"""
+        if self.process and self.process.poll() is None:
+            return True
+        return False
+    
+    def get_url(self):
+        """Get the backend base URL"""
+        return self.base_url
+
+class QuickSeedVideoPlayer:
+    def __init__(self, root, engine_path):
+        self.root = root
+        self.root.title("QuickSeed Video Player")
+        self.root.geometry(f"{DEFAULT_WIDTH}x{DEFAULT_HEIGHT}")
+        self.root.configure(bg='#1e1e1e')
+        
+        # Backend integration
+        self.backend = QuickSeedBackend(engine_path)
+        self.current_torrent = None
+        self.available_files = []
+        self.ws_connection = None
+        
+        # Latest WebSocket payload per message type, flushed to Tk on a timer
+        self._ui_pending = {}
+        self._ui_lock = threading.Lock()
+        self._flush_after = None
+        
+        # Video playback
+        self.video_container = None
+        self.video_stream = None
+        self.is_playing = False
+        self.is_fullscreen = False
+        self.current_frame = 0
+        self.total_frames = 0
+        self.video_fps = 30
+        self._total_time_str = "00:00"
+        self._last_progress_ui = 0.0
+        self.playback_thread = None
+        self._playback_container = None
+        self.stream_url = None
+        
+        # Containers still being decoded are closed by their playback thread
+        self._container_lock = threading.Lock()
+        self._decoding_containers = set()
+        self._closing = False
+        self._seek_target = None  # Seconds; applied by the playback thread
+        self._seek_after = None
+        
+        # Decoded frames waiting for the Tk renderer (newest wins)
+        self.frame_q = queue.Queue(maxsize=2)
+        self._enc_pool = ThreadPoolExecutor(max_workers=1)
+        self._ppm_cache = (None, None, None)
+        self._render_after = None
+        
+        # Persistent display image, rebuilt only when the frame size changes
+        self._photo = None
+        self._photo_size = None
+        
+        # UI Setup
+        self.setup_ui()
+        self.setup_key_bindings()
+        
+        # Start backend
+        self.start_backend()
+        
+    def setup_ui(self):
+        """Setup the user interface"""
+        # Create menu
+        self.create_menu_bar()
+        
+        # Main container
+        main_container = tk.Frame(self.root, bg='#1e1e1e')
+        main_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+        
+        # Toolbar
+        self.create_toolbar(main_container)
+        
+        # Video area
+        self.create_video_area(main_container)
+        
+        # Controls
+        self.create_controls(main_container)
+        
+        # Status bar
+        self.create_status_bar(main_container)
+        
+    def create_menu_bar(self):
+        """Create application menu bar"""
+        menubar = tk.Menu(self.root)
+        self.root.config(menu=menubar)
+        
+        # File menu
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Open Torrent File...", command=self.open_torrent_file, accelerator="Ctrl+O")
+        file_menu.add_command(label="Add Magnet Link...", command=self.add_magnet_dialog, accelerator="Ctrl+M")
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.on_closing, accelerator="Ctrl+Q")
+        
+        # View menu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="View", menu=view_menu)
+        view_menu.add_command(label="Fullscreen", command=self.toggle_fullscreen, accelerator="F11")
+        view_menu.add_command(label="Always on Top", command=self.toggle_always_on_top)
+        
+    def create_toolbar(self, parent):
+        """Create toolbar with torrent input"""
+        toolbar = tk.Frame(parent, bg='#2d2d30', height=50)
+        toolbar.pack(fill=tk.X, pady=(0, 8))
+        toolbar.pack_propagate(False)
+        
+        # Input section
+        input_frame = tk.Frame(toolbar, bg='#2d2d30')
+        input_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=8)
+        
+        tk.Label(input_frame, text="Torrent/Magnet URL:", 
+                bg='#2d2d30', fg='#ffffff', font=('Segoe UI', 9)).pack(side=tk.LEFT, padx=(0, 8))
+        
+        self.url_entry = tk.Entry(input_frame, bg='#3c3c3c', fg='#ffffff', 
+                                 insertbackground='#ffffff', font=('Consolas', 9), bd=1, relief=tk.SOLID)
+        self.url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8))
+        self.url_entry.bind('<Return>', lambda e: self.add_torrent())
+        
+        # Buttons
+        tk.Button(input_frame, text="Add Torrent", command=self.add_torrent,
+                 bg='#0e639c', fg='#ffffff', font=('Segoe UI', 9, 'bold'),
+                 relief=tk.FLAT, padx=12).pack(side=tk.LEFT, padx=2)
+        
+        tk.Button(input_frame, text="Browse...", command=self.open_torrent_file,
+                 bg='#404040', fg='#ffffff', font=('Segoe UI', 9),
+                 relief=tk.FLAT, padx=12).pack(side=tk.LEFT, padx=2)
+        
+        # File selector
+        self.file_var = tk.StringVar()
+        self.file_selector = ttk.Combobox(input_frame, textvariable=self.file_var, 
+                                         state="readonly", width=35, font=('Segoe UI', 9))
+        self.file_selector.pack(side=tk.RIGHT, padx=(8, 0))
+        self.file_selector.bind('<<ComboboxSelected>>', self.on_file_selection)
+        
+    def create_video_area(self, parent):
+        """Create video display area"""
+        video_container = tk.Frame(parent, bg='#000000', relief=tk.SUNKEN, bd=2)
+        video_container.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
+        
+        self.video_canvas = tk.Label(video_container, bg='#000000', 
+                                    text="QuickSeed Video Player\n\nDrop a torrent file or add a magnet link to start", 
+                                    fg='#888888', font=('Segoe UI', 14))
+        self.video_canvas.pack(expand=True, fill=tk.BOTH)
+        
+        # Track display size here so the decode thread never queries Tk
+        self._canvas_wh = (0, 0)
+        self._resize_cache = (None, None)
+        self.video_canvas.bind('<Configure>', lambda e: setattr(self, '_canvas_wh', (e.width, e.height)))
+        
+        # Likewise track minimize/restore of the main window
+        self._minimized = False
+        self.root.bind('<Unmap>', lambda e: e.widget is self.root and setattr(self, '_minimized', True), add='+')
+        self.root.bind('<Map>', lambda e: e.widget is self.root and setattr(self, '_minimized', False), add='+')
+        
+        # Drag and drop (basic implementation)
+        self.video_canvas.bind('<Button-1>', self.on_video_click)
+        
+    def create_controls(self, parent):
+        """Create playback controls"""
+        controls_container = tk.Frame(parent, bg='#2d2d30', height=100)
+        controls_container.pack(fill=tk.X, pady=(0, 8))
+        controls_container.pack_propagate(False)
+        
+        # Progress bar
+        progress_frame = tk.Frame(controls_container, bg='#2d2d30')
+        progress_frame.pack(fill=tk.X, padx=10, pady=(8, 0))
+        
+        self.progress_var = tk.DoubleVar()
+        self.progress_scale = ttk.Scale(progress_frame, from_=0, to=100, orient=tk.HORIZONTAL,
+                                       variable=self.progress_var, command=self.on_seek)
+        self.progress_scale.pack(fill=tk.X)
+        self.progress_scale.bind('<ButtonRelease-1>', lambda e: self._commit_seek(), add='+')
+        
+        # Control buttons
+        button_frame = tk.Frame(controls_container, bg='#2d2d30')
+        button_frame.pack(fill=tk.X, padx=10, pady=8)
+        
+        # Playback buttons
+        button_style = {'bg': '#404040', 'fg': '#ffffff', 'font': ('Segoe UI', 12, 'bold'),
+                       'relief': tk.FLAT, 'width': 4, 'state': tk.DISABLED}
+        
+        self.play_button = tk.Button(button_frame, text="▶", command=self.toggle_playback, **button_style)
+        self.play_button.pack(side=tk.LEFT, padx=2)
+        
+        self.stop_button = tk.Button(button_frame, text="⏹", command=self.stop_playback, **button_style)
+        self.stop_button.pack(side=tk.LEFT, padx=2)
+        
+        # Volume control
+        tk.Label(button_frame, text="Volume:", bg='#2d2d30', fg='#ffffff', 
+                font=('Segoe UI', 9)).pack(side=tk.LEFT, padx=(20, 5))
+        
+        self.volume_var = tk.DoubleVar(value=75)
+        volume_scale = ttk.Scale(button_frame, from_=0, to=100, orient=tk.HORIZONTAL,
+                               variable=self.volume_var, length=120)
+        volume_scale.pack(side=tk.LEFT, padx=5)
+        
+        # Time display
+        self.time_display = tk.Label(button_frame, text="00:00 / 00:00", 
+                                    bg='#2d2d30', fg='#ffffff', font=('Consolas', 10))
+        self.time_display.pack(side=tk.RIGHT, padx=10)
+        
+        # Download progress
+        self.download_progress = tk.Label(button_frame, text="", 
+                                         bg='#2d2d30', fg='#00ff00', font=('Segoe UI', 9))
+        self.download_progress.pack(side=tk.RIGHT, padx=10)
+        
+    def create_status_bar(self, parent):
+        """Create status bar"""
+        status_frame = tk.Frame(parent, bg='#2d2d30', height=25, relief=tk.SUNKEN, bd=1)
+        status_frame.pack(fill=tk.X)
+        status_frame.pack_propagate(False)
+        
+        self.status_label = tk.Label(status_frame, text="Starting QuickSeed-Engine...", 
+                                    bg='#2d2d30', fg='#ffffff', font=('Segoe UI', 9), anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT, padx=5, pady=2)
+        
+        self.backend_status = tk.Label(status_frame, text="●", 
+                                      bg='#2d2d30', fg='#ff0000', font=('Segoe UI', 12))
+        self.backend_status.pack(side=tk.RIGHT, padx=5, pady=2)
+        
+    def setup_key_bindings(self):
+        """Setup keyboard shortcuts"""
+        self.root.bind('<Control-o>', lambda e: self.open_torrent_file())
+        self.root.bind('<Control-m>', lambda e: self.add_magnet_dialog())
+        self.root.bind('<Control-q>', lambda e: self.on_closing())
+        self.root.bind('<F11>', lambda e: self.toggle_fullscreen())
+        self.root.bind('<space>', lambda e: self.toggle_playback())
+        self.root.bind('<Escape>', lambda e: self.exit_fullscreen())
+        
+    def start_backend(self):
+        """Start the QuickSeed-Engine backend"""
+        def start_thread():
+            if self.backend.start_engine():
+                self.root.after(0, lambda: self.update_status("QuickSeed-Engine started successfully"))
+                self.root.after(0, lambda: self.backend_status.config(fg='#00ff00'))
+                self.root.after(0, self.setup_websocket)
+            else:
+                self.root.after(0, lambda: self.update_status("Failed to start QuickSeed-Engine"))
+                self.root.after(0, lambda: self.backend_status.config(fg='#ff0000'))
+                
+        threading.Thread(target=start_thread, daemon=True).start()
+        
+    def setup_websocket(self):
+        """Setup WebSocket connection for real-time updates"""
+        def on_message(ws, message):
+            try:
+                data = orjson.loads(message)
+                msg_type = data.get('type')
+                
+                if msg_type in ('torrent_added', 'error'):
+                    self.root.after(0, lambda: self.handle_websocket_message(data))
+                else:
+                    # Coalesce high-rate updates; only the newest is rendered
+                    with self._ui_lock:
+                        self._ui_pending[msg_type] = data
+            except Exception as e:
+                print(f"WebSocket message error: {e}")
+                
+        def on_error(ws, error):
+            print(f"WebSocket error: {error}")
+            
+        def on_close(ws, close_status_code, close_msg):
+            print("WebSocket connection closed")
+            
+        def on_open(ws):
+            print("WebSocket connection established")
+            
+        try:
+            ws_url = f"ws://localhost:{self.backend.port}/ws"
+            self.ws_connection = websocket.WebSocketApp(
+                ws_url,
+                on_open=on_open,
+                on_message=on_message,
+                on_error=on_error,
+                on_close=on_close
+            )
+            
+            ws_thread = threading.Thread(
+                target=lambda: self.ws_connection.run_forever(
+                    skip_utf8_validation=True, ping_interval=20, ping_timeout=10),
+                daemon=True
+            )
+            ws_thread.start()
+            
+            if self._flush_after is None:
+                self._flush_after = self.root.after(100, self._flush_ui)
+            
+        except Exception as e:
+            print(f"WebSocket setup failed: {e}")
+            
+    def _flush_ui(self):
+        """Apply the latest batched WebSocket updates and reschedule"""
+        with self._ui_lock:
+            pending, self._ui_pending = self._ui_pending, {}
+            
+        for data in pending.values():
+            self.handle_websocket_message(data)
+            
+        self._flush_after = self.root.after(100, self._flush_ui)
+        
+    def handle_websocket_message(self, data):
+        """Handle WebSocket messages from backend"""
+        msg_type = data.get('type')
+        
+        if msg_type == 'download_progress':
+            progress = data.get('progress', 0)
+            speed = data.get('speed', 0)
+            self.download_progress.config(text=f"↓ {progress:.1f}% ({speed:.1f} KB/s)")
+            
+        elif msg_type == 'torrent_added':
+            self.current_torrent = data.get('torrent_id')
+            self.update_status(f"Torrent added: {data.get('name', 'Unknown')}")
+            self.refresh_file_list()
+            
+        elif msg_type == 'files_available':
+            self.refresh_file_list()
+            
+        elif msg_type == 'error':
+            self.update_status(f"Error: {data.get('message', 'Unknown error')}")
+            
+    def add_torrent(self):
+        """Add torrent from URL entry"""
+        url = self.url_entry.get().strip()
+        if not url:
+            messagebox.showerror("Error", "Please enter a torrent URL or magnet link")
+            return
+            
+        self.add_torrent_url(url)
+        
+    def add_torrent_url(self, url):
+        """Add torrent via URL/magnet"""
+        def add_thread():
+            try:
+                self.root.after(0, lambda: self.update_status("Adding torrent..."))
+                
+                if url.startswith("magnet:"):
+                    payload = {"magnet_link": url}
+                else:
+                    payload = {"torrent_url": url}
+                    
+                response = self.backend.session.post(f"{self.backend.get_url()}/api/torrents", 
+                                                     json=payload, timeout=30)
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    self.current_torrent = result.get('torrent_id')
+                    self.root.after(0, lambda: self.update_status("Torrent added successfully"))
+                    self.root.after(0, self.refresh_file_list)
+                else:
+                    error = f"Failed to add torrent: {response.text}"
+                    self.root.after(0, lambda: self.update_status(error))
+                    
+            except Exception as e:
+                error = f"Error adding torrent: {str(e)}"
+                self.root.after(0, lambda: self.update_status(error))
+                
+        threading.Thread(target=add_thread, daemon=True).start()
+        
+    def open_torrent_file(self):
+        """Open torrent file dialog"""
+        file_path = filedialog.askopenfilename(
+            title="Select Torrent File",
+            filetypes=[("Torrent files", "*.torrent"), ("All files", "*.*")]
+        )
+        
+        if file_path:
+            self.upload_torrent_file(file_path)
+            
+    def upload_torrent_file(self, file_path):
+        """Upload torrent file to backend"""
+        def upload_thread():
+            try:
+                self.root.after(0, lambda: self.update_status("Uploading torrent file..."))
+                
+                with open(file_path, 'rb') as f:
+                    files = {'torrent_file': f}
+                    response = self.backend.session.post(f"{self.backend.get_url()}/api/torrents/upload", 
+                                                         files=files, timeout=30)
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    self.current_torrent = result.get('torrent_id')
+                    self.root.after(0, lambda: self.update_status("Torrent file uploaded successfully"))
+                    self.root.after(0, self.refresh_file_list)
+                else:
+                    error = f"Failed to upload torrent: {response.text}"
+                    self.root.after(0, lambda: self.update_status(error))
+                    
+            except Exception as e:
+                error = f"Error uploading torrent: {str(e)}"
+                self.root.after(0, lambda: self.update_status(error))
+                
+        threading.Thread(target=upload_thread, daemon=True).start()
+        
+    def add_magnet_dialog(self):
+        """Show magnet link input dialog"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Add Magnet Link")
+        dialog.geometry("500x150")
+        dialog.configure(bg='#2d2d30')
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        tk.Label(dialog, text="Enter Magnet Link:", bg='#2d2d30', fg='#ffffff', 
+                font=('Segoe UI', 10)).pack(pady=10)
+        
+        entry = tk.Entry(dialog, width=60, bg='#3c3c3c', fg='#ffffff', 
+                        insertbackground='#ffffff', font=('Consolas', 9))
+        entry.pack(pady=10, padx=20, fill=tk.X)
+        entry.focus()
+        
+        button_frame = tk.Frame(dialog, bg='#2d2d30')
+        button_frame.pack(pady=10)
+        
+        def on_add():
+            magnet = entry.get().strip()
+            if magnet:
+                self.add_torrent_url(magnet)
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Please enter a magnet link")
+                
+        tk.Button(button_frame, text="Add", command=on_add, bg='#0e639c', fg='#ffffff',
+                 font=('Segoe UI', 9, 'bold'), padx=20).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(button_frame, text="Cancel", command=dialog.destroy, bg='#404040', fg='#ffffff',
+                 font=('Segoe UI', 9), padx=20).pack(side=tk.LEFT, padx=5)
+        
+        entry.bind('<Return>', lambda e: on_add())
+        
+    def refresh_file_list(self):
+        """Refresh available files from backend"""
+        if not self.current_torrent:
+            return
+            
+        def refresh_thread():
+            try:
+                response = self.backend.session.get(f"{self.backend.get_url()}/api/torrents/{self.current_torrent}/files")
+                if response.status_code == 200:
+                    files = orjson.loads(response.content).get('files', [])
+                    
+                    # Filter video files
+                    video_files = [f for f in files if os.path.splitext(f['name'])[1].lower() in VIDEO_EXTS]
+                    
+                    self.available_files = video_files
+                    file_names = [f['name'] for f in video_files]
+                    
+                    self.root.after(0, lambda: self.file_selector.config(values=file_names))
+                    
+                    if video_files:
+                        self.root.after(0, lambda: self.file_selector.set(file_names[0]))
+                        self.root.after(0, lambda: self.update_status(f"Found {len(video_files)} video files"))
+                    else:
+                        self.root.after(0, lambda: self.update_status("No video files found"))
+                        
+            except Exception as e:
+                error = f"Error refreshing files: {str(e)}"
+                self.root.after(0, lambda: self.update_status(error))
+                
+        threading.Thread(target=refresh_thread, daemon=True).start()
+        
+    def on_file_selection(self, event=None):
+        """Handle file selection from combobox"""
+        selected_file = self.file_var.get()
+        if not selected_file or not self.current_torrent:
+            return
+            
+        # Find file info
+        file_info = None
+        for f in self.available_files:
+            if f['name'] == selected_file:
+                file_info = f
+                break
+                
+        if file_info:
+            # Build stream URL
+            encoded_filename = urllib.parse.quote(file_info['name'])
+            self.stream_url = f"{self.backend.get_url()}/api/stream/{self.current_torrent}/{encoded_filename}"
+            
+            self.load_video_stream(selected_file)
+            
+    def load_video_stream(self, filename):
+        """Load video stream for playback"""
+        def load_thread():
+            try:
+                self.root.after(0, lambda: self.update_status(f"Loading video: {filename}"))
+                
+                # Open video stream with PyAV, keeping one demuxer for the
+                # whole session and letting FFmpeg decode on several threads
+                container = av.open(self.stream_url)
+                
+                if container.streams.video:
+                    stream = container.streams.video[0]
+                    stream.thread_type = 'AUTO'
+                    print(f"Video codec: {stream.codec_context.name}")
+                    
+                    # Stop any current playback before swapping containers
+                    if self.is_playing:
+                        self.is_playing = False
+                        self.root.after(0, self.pause_video)
+                    with self._container_lock:
+                        old_container = self.video_container
+                        self.video_container = container
+                        self.video_stream = stream
+                        if old_container and old_container not in self._decoding_containers:
+                            old_container.close()
+                    self.video_fps = float(stream.average_rate or 30)
+                    self.total_frames = stream.frames
+                    if not self.total_frames and container.duration:
+                        self.total_frames = int(container.duration / av.time_base * self.video_fps)
+                    self._total_time_str = self.format_time(self.total_frames / self.video_fps)
+                    self.current_frame = 0
+                    
+                    # Enable controls
+                    self.root.after(0, lambda: self.play_button.config(state=tk.NORMAL))
+                    self.root.after(0, lambda: self.stop_button.config(state=tk.NORMAL))
+                    
+                    self.root.after(0, lambda: self.update_status(f"Ready to play: {filename}"))
+                else:
+                    container.close()
+                    self.root.after(0, lambda: self.update_status(f"Failed to load video: {filename}"))
+                    
+            except Exception as e:
+                error = f"Error loading video: {str(e)}"
+                self.root.after(0, lambda: self.update_status(error))
+                
+        threading.Thread(target=load_thread, daemon=True).start()
+        
+    def toggle_playback(self):
+        """Toggle play/pause"""
+        if not self.video_container:
+            return
+            
+        if self.is_playing:
+            self.pause_video()
+        else:
+            self.play_video()
+            
+    def play_video(self):
+        """Start video playback"""
+        if not self.video_container:
+            return
+            
+        self.is_playing = True
+        self.play_button.config(text="⏸")
+        
+        # A thread still draining a replaced container exits on its own
+        if (not self.playback_thread or not self.playback_thread.is_alive()
+                or self._playback_container is not self.video_container):
+            self._playback_container = self.video_container
+            self.playback_thread = threading.Thread(target=self.playback_loop,
+                                                    args=(self.video_container,), daemon=True)
+            self.playback_thread.start()
+            
+        if self._render_after is None:
+            self._render_after = self.root.after(int(1000 / max(self.video_fps, 1)), self._render_tick)
+            
+    def pause_video(self):
+        """Pause video playback"""
+        self.is_playing = False
+        self.play_button.config(text="▶")
+        
+    def stop_playback(self):
+        """Stop video playback"""
+        self.is_playing = False
+        self.current_frame = 0
+        
+        if self.video_container:
+            self._seek_target = 0
+            
+        self.play_button.config(text="▶")
+        self.progress_var.set(0)
+        self.update_status("Stopped")
+        
+    def on_seek(self, value):
+        """Handle seek operation, committing once the scrub bar settles"""
+        if not self.video_container or self.total_frames == 0:
+            return
+            
+        if self._seek_after is not None:
+            self.root.after_cancel(self._seek_after)
+        self._seek_after = self.root.after(100, lambda v=value: self._commit_seek(v))
+        
+    def _commit_seek(self, value=None):
+        """Apply the pending seek, or the current scrub position on release"""
+        if self._seek_after is None:
+            return
+            
+        self.root.after_cancel(self._seek_after)
+        self._seek_after = None
+        
+        if value is None:
+            value = self.progress_var.get()
+            
+        progress = float(value)
+        target_frame = int((progress / 100) * self.total_frames)
+        
+        self._seek_target = target_frame / self.video_fps
+        self.current_frame = target_frame
+        
+    def playback_loop(self, container):
+        """Main video playback loop"""
+        with self._container_lock:
+            if self._closing or container is not self.video_container:
+                return
+            stream = self.video_stream
+            self._decoding_containers.add(container)
+            
+        frame_period = 1.0 / max(self.video_fps, 1)
+        deadline = time.monotonic()
+        pending = None  # Encode of the previous frame, at most one in flight
+        frames = None
+        seek_floor = None
+        frame_idx = self.current_frame
+        resync = True  # Restart the clock on the first frame shown
+        dropped = 0  # Consecutive late frames skipped
+        
+        # While behind schedule the decoder skips non-reference frames
+        codec = stream.codec_context
+        codec.skip_frame = 'DEFAULT'
+        nonref = False
+        
+        try:
+            while self.is_playing and self.video_container is container:
+                if self._seek_target is not None:
+                    # Seeks run here since PyAV containers are not thread-safe
+                    seek_floor, self._seek_target = self._seek_target, None
+                    container.seek(int(seek_floor * av.time_base))
+                    frames = None
+                    resync = True
+                    if nonref:
+                        nonref = False
+                        codec.skip_frame = 'DEFAULT'
+                    
+                if frames is None:
+                    frames = container.decode(stream)
+                    
+                frame = next(frames, None)
+                
+                if frame is None:
+                    if pending is not None:
+                        self.push_frame(pending.result())
+                    self.root.after(0, self.pause_video)
+                    self.root.after(0, lambda: self.update_status("End of video"))
+                    break
+                    
+                if seek_floor is not None and frame.time is not None:
+                    # Seeks land on the preceding keyframe; decode up to the target
+                    if frame.time < seek_floor:
+                        continue
+                    seek_floor = None
+                    frame_idx = int(frame.time * self.video_fps)
+                elif nonref and frame.time is not None:
+                    # Frames may have been skipped by the decoder: re-anchor on
+                    # the timestamp and move the deadline on to this frame's slot
+                    new_idx = int(frame.time * self.video_fps)
+                    if new_idx > frame_idx + 1:
+                        deadline += (new_idx - frame_idx - 1) * frame_period
+                    frame_idx = max(new_idx, frame_idx + 1)
+                else:
+                    frame_idx += 1
+                self.current_frame = frame_idx
+                    
+                # A fresh start or seek, or too far behind to catch up by
+                # dropping frames: restart the clock from this frame
+                now = time.monotonic()
+                if resync or now - deadline > 2 * frame_period:
+                    resync = False
+                    deadline = now
+                    
+                # Behind schedule: stop decoding non-reference frames until
+                # caught up, and drop this one without converting it, but never
+                # more than two in a row so the picture keeps moving
+                late = now - deadline > frame_period
+                if late != nonref:
+                    nonref = late
+                    codec.skip_frame = 'NONREF' if late else 'DEFAULT'
+                skip = late and dropped < 2
+                dropped = dropped + 1 if skip else 0
+                
+                # Nothing visible to draw into: keep the clock running, skip conversion and encode
+                hidden = self.is_display_hidden()
+                
+                deadline += frame_period
+                
+                # Update progress and time, at most every 250ms
+                if now - self._last_progress_ui > 0.25:
+                    self._last_progress_ui = now
+                    
+                    if self.total_frames > 0:
+                        progress = (self.current_frame / self.total_frames) * 100
+                        self.root.after(0, lambda p=progress: self.progress_var.set(p))
+                        
+                    # Update time display
+                    current_time = self.current_frame / self.video_fps
+                    time_str = f"{self.format_time(current_time)} / {self._total_time_str}"
+                    self.root.after(0, lambda t=time_str: self.time_display.config(text=t))
+                    
+                if skip:
+                    continue
+                    
+                # Hand the previous frame to the renderer and encode this one
+                # in the background while the next frame decodes
+                if pending is not None:
+                    self.push_frame(pending.result())
+                    pending = None
+                if not hidden:
+                    pending = self._enc_pool.submit(self.encode_frame, frame)
+                    
+                # Control playback speed against a monotonic deadline
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                    
+        except av.error.FFmpegError as e:
+            error = f"Playback error: {str(e)}"
+            self.root.after(0, self.pause_video)
+            self.root.after(0, lambda: self.update_status(error))
+            
+        finally:
+            # Nobody else closes a container while it is being decoded, so
+            # release it here if it was replaced or the player is closing
+            with self._container_lock:
+                self._decoding_containers.discard(container)
+                if self._closing or container is not self.video_container:
+                    container.close()
+                    
+                # The last decoder out stops the encoder it was submitting to
+                if self._closing and not self._decoding_containers:
+                    self._enc_pool.shutdown(wait=False)
+                    
+    def is_display_hidden(self):
+        """Check whether there is currently no visible area to render into"""
+        canvas_width, canvas_height = self._canvas_wh
+        return canvas_width <= 1 or canvas_height <= 1 or self._minimized
+        
+    def encode_frame(self, frame):
+        """Scale a decoded frame for display and encode it as (width, height, ppm_data)"""
+        width, height, interpolation = self.display_size(frame.width, frame.height)
+        
+        # swscale resizes and converts to RGB in one pass, so the colour
+        # conversion only ever touches display-sized pixels
+        display_frame = frame.to_ndarray(width=width, height=height, format='rgb24',
+                                         interpolation=interpolation)
+        
+        # Reuse the PPM header and buffer until the display size changes
+        size, pixels, ppm_buf = self._ppm_cache
+        if size != (width, height):
+            header = b'P6\n%d %d\n255\n' % (width, height)
+            ppm_buf = bytearray(len(header) + width * height * 3)
+            ppm_buf[:len(header)] = header
+            pixels = np.frombuffer(ppm_buf, np.uint8, offset=len(header)).reshape(height, width, 3)
+            self._ppm_cache = ((width, height), pixels, ppm_buf)
+            
+        # Raw PPM bytes for Tk, no PIL round-trip
+        np.copyto(pixels, display_frame)
+        return width, height, bytes(ppm_buf)
+        
+    def push_frame(self, frame):
+        """Queue a (width, height, ppm_data) frame, dropping the oldest if the renderer lags"""
+        try:
+            self.frame_q.put_nowait(frame)
+        except queue.Full:
+            try:
+                self.frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self.frame_q.put_nowait(frame)
+            
+    def _render_tick(self):
+        """Display the newest queued frame and reschedule"""
+        frame = None
+        try:
+            while True:
+                frame = self.frame_q.get_nowait()
+        except queue.Empty:
+            pass
+            
+        if frame is not None:
+            self.update_video_display(*frame)
+            
+        if self.is_playing:
+            self._render_after = self.root.after(int(1000 / max(self.video_fps, 1)), self._render_tick)
+        else:
+            self._render_after = None
+            
+    def display_size(self, frame_width, frame_height):
+        """Get the (width, height, interpolation) to fit a frame in the display area"""
+        canvas_width, canvas_height = self._canvas_wh
+        
+        if canvas_width <= 1 or canvas_height <= 1:
+            return frame_width, frame_height, None
+            
+        # Never encode more than MAX_DISPLAY size, even on huge canvases
+        canvas_width = min(canvas_width, MAX_DISPLAY_WIDTH)
+        canvas_height = min(canvas_height, MAX_DISPLAY_HEIGHT)
+        
+        # Reuse the target size while neither canvas nor source changed
+        key = (canvas_width, canvas_height, frame_width, frame_height)
+        cached_key, new_size = self._resize_cache
+        if key != cached_key:
+            # Calculate scaling to fit while maintaining aspect ratio
+            scale_w = canvas_width / frame_width
+            scale_h = canvas_height / frame_height
+            scale = min(scale_w, scale_h)
+            
+            new_size = (int(frame_width * scale), int(frame_height * scale),
+                        'AREA' if scale < 1 else 'BILINEAR')
+            self._resize_cache = (key, new_size)
+            
+        return new_size
+        
+    def update_video_display(self, width, height, data):
+        """Update video display with new frame"""
+        if self._photo is not None and self._photo_size == (width, height):
+            # Same size: load the new pixels into the existing image
+            self._photo.configure(data=data, format='PPM')
+            return
+            
+        self._photo = tk.PhotoImage(width=width, height=height, data=data, format='PPM')
+        self._photo_size = (width, height)
+        self.video_canvas.configure(image=self._photo, text="")
+        self.video_canvas.image = self._photo  # Keep a reference
+        
+    def format_time(self, seconds):
+        """Format time as MM:SS"""
+        minutes = int(seconds // 60)
+        seconds = int(seconds % 60)
+        return f"{minutes:02d}:{seconds:02d}"
+        
+    def update_status(self, message):
+        """Update status bar message"""
+        self.status_label.config(text=message)
+        
+    def on_video_click(self, event):
+        """Handle video area clicks"""
+        if self.video_container:
+            self.toggle_playback()
+            
+    def toggle_fullscreen(self):
+        """Toggle fullscreen mode"""
+        self.is_fullscreen = not self.is_fullscreen
+        self.root.attributes('-fullscreen', self.is_fullscreen)
+        
+        if self.is_fullscreen:
+            # Hide UI elements in fullscreen
+            self.root.config(cursor="none")
+        else:
+            self.root.config(cursor="")
+            
+    def exit_fullscreen(self):
+        """Exit fullscreen mode"""
+        if self.is_fullscreen:
+            self.is_fullscreen = False
+            self.root.attributes('-fullscreen', False)
+            self.root.config(cursor="")
+            
+    def toggle_always_on_top(self):
+        """Toggle always on top"""
+        current = self.root.attributes('-topmost')
+        self.root.attributes('-topmost', not current)
+        
+    def on_closing(self):
+        """Handle application closing"""
+        # Stop playback
+        self.is_playing = False
+        self._closing = True
+        
+        if self._render_after is not None:
+            self.root.after_cancel(self._render_after)
+            self._render_after = None
+            
+        if self._flush_after is not None:
+            self.root.after_cancel(self._flush_after)
+            self._flush_after = None
+            
+        if self._seek_after is not None:
+            self.root.after_cancel(self._seek_after)
+            self._seek_after = None
+            
+        # Release video resources and the encoder, unless a playback thread
+        # still holds them; it releases them itself on the way out
+        with self._container_lock:
+            if self.video_container and self.video_container not in self._decoding_containers:
+                self.video_container.close()
+            if not self._decoding_containers:
+                self._enc_pool.shutdown(wait=False)
+            
+        # Close WebSocket
+        if self.ws_connection:
+            self.ws_connection.close()
+            
+        # Stop backend
+        self.backend.stop_engine()
+        
+        # Destroy window
+        self.root.destroy()